@@ -9,20 +9,24 @@ from twisted.internet.defer import Deferred
 from twisted.internet.protocol import ClientFactory
 from twisted.protocols.basic import LineReceiver
 
+END = b"Bye-bye!"
+GREETING = b"Hello, world!\r\nWhat a fine day it is.\r\n" + END + b"\r\n"
 
 
-class EchoClient(LineReceiver):
-    end = "Bye-bye!"
 
+class EchoClient(LineReceiver):
     def connectionMade(self):
-        self.sendLine("Hello, world!")
-        self.sendLine("What a fine day it is.")
-        self.sendLine(self.end)
+        # Don't let Nagle's algorithm hold the greeting back waiting for an ACK
+        # of earlier data, such as the end of a TLS handshake.
+        self.transport.setTcpNoDelay(True)
+        # All three lines go out in a single write (and so a single TLS record
+        # when running over TLS).
+        self.transport.write(GREETING)
 
 
     def lineReceived(self, line):
         print("receive:", line)
-        if line == self.end:
+        if line == END:
             self.transport.loseConnection()
 
 
@@ -3,14 +3,14 @@
 # See LICENSE for details.
 
 from twisted.internet import ssl, task, protocol, endpoints, defer
-from twisted.python.modules import getModule
+from twisted.python.filepath import FilePath
 
 import echoclient
 
 @defer.inlineCallbacks
 def main(reactor):
     factory = protocol.Factory.forProtocol(echoclient.EchoClient)
-    certData = getModule(__name__).filePath.sibling('public.pem').getContent()
+    certData = FilePath(__file__).sibling('public.pem').getContent()
     authority = ssl.Certificate.loadPEM(certData)
     options = ssl.optionsForClientTLS(u'example.com', authority)
     endpoint = endpoints.SSL4ClientEndpoint(reactor, 'localhost', 8000,
@@ -22,5 +22,4 @@ def main(reactor):
     yield done
 
 if __name__ == '__main__':
-    import echoclient_ssl
-    task.react(echoclient_ssl.main)
+    task.react(main)
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# Copyright (c) Twisted Matrix Laboratories.
+# See LICENSE for details.
+
+from zope.interface import implementer
+
+from twisted.application.internet import ClientService
+from twisted.internet import ssl, task, protocol, endpoints, defer
+from twisted.internet.interfaces import IOpenSSLClientConnectionCreator
+from twisted.python.filepath import FilePath
+
+import echoclient
+
+@implementer(IOpenSSLClientConnectionCreator)
+class ResumingClientOptions(object):
+    """
+    Client TLS options which offer the session negotiated by the previous
+    connection, so that reconnecting performs an abbreviated handshake.
+    """
+    def __init__(self, options):
+        self._options = options
+        self._session = None
+
+    def clientConnectionForTLS(self, tlsProtocol):
+        connection = self._options.clientConnectionForTLS(tlsProtocol)
+        if self._session is not None:
+            connection.set_session(self._session)
+        return connection
+
+    def saveSession(self, connection):
+        session = connection.get_session()
+        if session is not None:
+            self._session = session
+
+class ResumingEchoClient(echoclient.EchoClient):
+    """
+    Echo client which saves its TLS session when it disconnects, so that the
+    next connection made with the same options can resume it.
+    """
+    def connectionLost(self, reason):
+        self.factory.options.saveSession(self.transport.getHandle())
+        echoclient.EchoClient.connectionLost(self, reason)
+
+def main(reactor):
+    certData = FilePath(__file__).sibling('public.pem').getContent()
+    authority = ssl.Certificate.loadPEM(certData)
+    factory = protocol.Factory.forProtocol(ResumingEchoClient)
+    factory.options = ResumingClientOptions(
+        ssl.optionsForClientTLS(u'example.com', authority))
+    endpoint = endpoints.SSL4ClientEndpoint(reactor, 'localhost', 8000,
+                                            factory.options)
+    # Reconnect each time the server closes the connection, until interrupted.
+    ClientService(endpoint, factory).startService()
+    return defer.Deferred()
+
+if __name__ == '__main__':
+    task.react(main)
@@ -178,6 +178,22 @@ def urlparse(url):
 
 
 
+def _unquotePlus(s):
+    """
+    Decode a query string component, turning C{+} into a space and undoing
+    percent-encoding.
+
+    @type s: C{bytes}
+    @rtype: C{bytes}
+    """
+    s = s.replace(b"+", b" ")
+    if b"%" in s:
+        return unquote(s)
+    # Most names and values contain no escapes at all.
+    return s
+
+
+
 def parse_qs(qs, keep_blank_values=0, strict_parsing=0):
     """
     Like C{cgi.parse_qs}, but with support for parsing byte strings on Python 3.
@@ -185,8 +201,7 @@ def parse_qs(qs, keep_blank_values=0, strict_parsing=0):
     @type qs: C{bytes}
     """
     d = {}
-    items = [s2 for s1 in qs.split(b"&") for s2 in s1.split(b";")]
-    for item in items:
+    for item in qs.replace(b";", b"&").split(b"&"):
         try:
             k, v = item.split(b"=", 1)
         except ValueError:
@@ -194,8 +209,8 @@ def parse_qs(qs, keep_blank_values=0, strict_parsing=0):
                 raise
             continue
         if v or keep_blank_values:
-            k = unquote(k.replace(b"+", b" "))
-            v = unquote(v.replace(b"+", b" "))
+            k = _unquotePlus(k)
+            v = _unquotePlus(v)
             if k in d:
                 d[k].append(v)
             else:
@@ -204,14 +219,30 @@ def parse_qs(qs, keep_blank_values=0, strict_parsing=0):
 
 
 
+# The current second most recently formatted by datetimeToString and its
+# result, so that the Date headers of all responses sent within one second
+# share a single formatting.  Explicitly given times, such as Last-Modified
+# values, are not remembered, so that they do not evict it.
+_lastDateTime = (None, None)
+
+
+
 def datetimeToString(msSinceEpoch=None):
     """
     Convert seconds since epoch to HTTP datetime string.
 
     @rtype: C{bytes}
     """
+    global _lastDateTime
     if msSinceEpoch == None:
-        msSinceEpoch = time.time()
+        second = int(time.time())
+        # Read the memo once, as another thread may replace it at any time.
+        cached = _lastDateTime
+        if cached[0] == second:
+            return cached[1]
+        s = datetimeToString(second)
+        _lastDateTime = (second, s)
+        return s
     year, month, day, hh, mm, ss, wd, y, z = time.gmtime(msSinceEpoch)
     s = networkString("%s, %02d %3s %4d %02d:%02d:%02d GMT" % (
             weekdayname[wd],
@@ -905,11 +936,8 @@ class Request:
         if not self.startedWriting:
             self.startedWriting = 1
             version = self.clientproto
-            l = []
-            l.append(
-                version + b" " +
-                intToBytes(self.code) + b" " +
-                self.code_message + b"\r\n")
+            l = [version, b" ", intToBytes(self.code), b" ",
+                 self.code_message, b"\r\n"]
 
             # if we don't have a content length, we send data in
             # chunked mode, so that we can support pipelining in
@@ -944,7 +972,7 @@ class Request:
                     l.extend([name, b": ", value, b"\r\n"])
 
             for cookie in self.cookies:
-                l.append(b'Set-Cookie: ' + cookie + b'\r\n')
+                l.extend([b'Set-Cookie: ', cookie, b'\r\n'])
 
             l.append(b"\r\n")
 
@@ -1031,22 +1059,22 @@ class Request:
 
             return str(val).encode('utf8')
 
-        cookie = _ensureBytes(k) + b"=" + _ensureBytes(v)
+        cookie = [_ensureBytes(k), b"=", _ensureBytes(v)]
         if expires is not None:
-            cookie = cookie + b"; Expires=" + _ensureBytes(expires)
+            cookie.extend([b"; Expires=", _ensureBytes(expires)])
         if domain is not None:
-            cookie = cookie + b"; Domain=" + _ensureBytes(domain)
+            cookie.extend([b"; Domain=", _ensureBytes(domain)])
         if path is not None:
-            cookie = cookie + b"; Path=" + _ensureBytes(path)
+            cookie.extend([b"; Path=", _ensureBytes(path)])
         if max_age is not None:
-            cookie = cookie + b"; Max-Age=" + _ensureBytes(max_age)
+            cookie.extend([b"; Max-Age=", _ensureBytes(max_age)])
         if comment is not None:
-            cookie = cookie + b"; Comment=" + _ensureBytes(comment)
+            cookie.extend([b"; Comment=", _ensureBytes(comment)])
         if secure:
-            cookie = cookie + b"; Secure"
+            cookie.append(b"; Secure")
         if httpOnly:
-            cookie = cookie + b"; HttpOnly"
-        self.cookies.append(cookie)
+            cookie.append(b"; HttpOnly")
+        self.cookies.append(b"".join(cookie))
 
     def setResponseCode(self, code, message=None):
         """
@@ -1506,57 +1534,55 @@ class _ChunkedTransferDecoder(object):
         self._buffer = b''
 
 
-    def _dataReceived_CHUNK_LENGTH(self, data):
-        if b'\r\n' in data:
-            line, rest = data.split(b'\r\n', 1)
-            parts = line.split(b';')
-            try:
-                self.length = int(parts[0], 16)
-            except ValueError:
-                raise _MalformedChunkedDataError(
-                    "Chunk-size must be an integer.")
-            if self.length == 0:
-                self.state = 'TRAILER'
-            else:
-                self.state = 'BODY'
-            return rest
+    def _dataReceived_CHUNK_LENGTH(self, data, start):
+        end = data.find(b'\r\n', start)
+        if end == -1:
+            self._buffer = data[start:]
+            return len(data)
+        parts = data[start:end].split(b';', 1)
+        try:
+            self.length = int(parts[0], 16)
+        except ValueError:
+            raise _MalformedChunkedDataError(
+                "Chunk-size must be an integer.")
+        if self.length == 0:
+            self.state = 'TRAILER'
         else:
-            self._buffer = data
-            return b''
+            self.state = 'BODY'
+        return end + 2
 
 
-    def _dataReceived_CRLF(self, data):
-        if data.startswith(b'\r\n'):
+    def _dataReceived_CRLF(self, data, start):
+        if data.startswith(b'\r\n', start):
             self.state = 'CHUNK_LENGTH'
-            return data[2:]
+            return start + 2
         else:
-            self._buffer = data
-            return b''
+            self._buffer = data[start:]
+            return len(data)
 
 
-    def _dataReceived_TRAILER(self, data):
-        if data.startswith(b'\r\n'):
-            data = data[2:]
+    def _dataReceived_TRAILER(self, data, start):
+        if data.startswith(b'\r\n', start):
             self.state = 'FINISHED'
-            self.finishCallback(data)
+            self.finishCallback(data[start + 2:])
         else:
-            self._buffer = data
-        return b''
+            self._buffer = data[start:]
+        return len(data)
 
 
-    def _dataReceived_BODY(self, data):
-        if len(data) >= self.length:
-            chunk, data = data[:self.length], data[self.length:]
-            self.dataCallback(chunk)
+    def _dataReceived_BODY(self, data, start):
+        end = start + self.length
+        if end <= len(data):
+            self.dataCallback(data[start:end])
             self.state = 'CRLF'
-            return data
-        elif len(data) < self.length:
-            self.length -= len(data)
-            self.dataCallback(data)
-            return b''
+            return end
+        else:
+            self.length = end - len(data)
+            self.dataCallback(data[start:])
+            return len(data)
 
 
-    def _dataReceived_FINISHED(self, data):
+    def _dataReceived_FINISHED(self, data, start):
         raise RuntimeError(
             "_ChunkedTransferDecoder.dataReceived called after last "
             "chunk was processed")
@@ -1569,8 +1595,14 @@ class _ChunkedTransferDecoder(object):
         """
         data = self._buffer + data
         self._buffer = b''
-        while data:
-            data = getattr(self, '_dataReceived_%s' % (self.state,))(data)
+        # Each state handler consumes data from the given offset and returns
+        # the offset at which the next state should continue, so the input is
+        # only sliced for the pieces passed on, not once per state change.
+        start = 0
+        size = len(data)
+        while start < size:
+            start = getattr(self, '_dataReceived_%s' % (self.state,))(
+                data, start)
 
 
     def noMoreData(self):
@@ -25,6 +25,17 @@ def _dashCapitalize(name):
 
 
 
+# Canonical forms of the header names found on most responses, so that
+# writing them out is a dictionary lookup rather than a recapitalization.
+_commonCanonicalNames = dict(
+    (name, _dashCapitalize(name)) for name in [
+        b'cache-control', b'connection', b'content-encoding',
+        b'content-length', b'content-type', b'date', b'expires',
+        b'last-modified', b'location', b'server', b'set-cookie',
+        b'transfer-encoding'])
+
+
+
 @comparable
 class Headers(object):
     """
@@ -216,14 +227,16 @@ class Headers(object):
         @type value: L{bytes} or L{unicode}
         @param value: The value to set for the named header.
         """
-        values = self.getRawHeaders(name)
+        # Append to the stored list in place; going through setRawHeaders
+        # would re-encode every earlier value, making N additions of the same
+        # header quadratic.
+        encodedName = self._encodeName(name)
+        values = self._rawHeaders.get(encodedName)
 
         if values is not None:
-            values.append(value)
+            values.append(self._encodeValue(value))
         else:
-            values = [value]
-
-        self.setRawHeaders(name, values)
+            self._rawHeaders[encodedName] = [self._encodeValue(value)]
 
 
     def getRawHeaders(self, name, default=None):
@@ -269,7 +282,12 @@ class Headers(object):
         @rtype: L{bytes}
         @return: The canonical name of the header.
         """
-        return self._caseMappings.get(name, _dashCapitalize(name))
+        canonicalName = self._caseMappings.get(name)
+        if canonicalName is None:
+            canonicalName = _commonCanonicalNames.get(name)
+            if canonicalName is None:
+                canonicalName = _dashCapitalize(name)
+        return canonicalName
 
 
 
@@ -8,6 +8,7 @@ Test HTTP support.
 from __future__ import absolute_import, division
 
 import random, cgi, base64
+from itertools import chain
 
 try:
     from urlparse import urlparse, urlunsplit, clear_cache
@@ -31,15 +32,78 @@ from twisted.web.test.requesthelper import DummyChannel
 
 
 
+def _inChunks(data, chunkSize=64):
+    """
+    Split C{data} into consecutive pieces, so that tests can deliver it to a
+    protocol in several C{dataReceived} calls without paying for one call per
+    byte.
+
+    @param data: The bytes to split.
+    @type data: L{bytes}
+
+    @param chunkSize: The length of each piece; the last one may be shorter.
+    @type chunkSize: L{int}
+
+    @return: An iterator of L{bytes}.
+    """
+    for start in range(0, len(data), chunkSize):
+        yield data[start:start + chunkSize]
+
+
+
 class DateTimeTests(unittest.TestCase):
     """Test date parsing functions."""
 
     def testRoundtrip(self):
-        for i in range(10000):
-            time = random.randint(0, 2000000000)
-            timestr = http.datetimeToString(time)
-            time2 = http.stringToDatetime(timestr)
-            self.assertEqual(time, time2)
+        # The epoch, the end of 32-bit time_t and the top of the random range,
+        # plus a random sample in between.
+        times = [0, 1, 2 ** 31 - 1, 2000000000]
+        times.extend(random.randint(0, 2000000000) for i in range(200))
+        roundtripped = [http.stringToDatetime(http.datetimeToString(time))
+                        for time in times]
+        self.assertEqual(times, roundtripped)
+
+
+    def test_datetimeToStringCurrentTimeOncePerSecond(self):
+        """
+        L{http.datetimeToString} called without a time formats the current
+        time only once per second, and formats it afresh in the next second.
+        """
+        gmtime = http.time.gmtime
+
+        class FakeTime(object):
+            """
+            Stand-in for the L{time} module in L{http}, with a settable current
+            time, which records each time it is asked to convert.
+            """
+            def __init__(self, now):
+                self.now = now
+                self.formatted = []
+
+            def time(self):
+                return self.now
+
+            def gmtime(self, seconds):
+                self.formatted.append(seconds)
+                return gmtime(seconds)
+
+        fakeTime = FakeTime(86400.25)
+        self.patch(http, "_lastDateTime", (None, None))
+        self.patch(http, "time", fakeTime)
+
+        first = http.datetimeToString()
+        fakeTime.now = 86400.75
+        second = http.datetimeToString()
+        self.assertEqual(
+            [first, second],
+            [b"Fri, 02 Jan 1970 00:00:00 GMT"] * 2)
+        self.assertEqual(fakeTime.formatted, [86400])
+
+        fakeTime.now = 86401
+        self.assertEqual(http.datetimeToString(),
+                         b"Fri, 02 Jan 1970 00:00:01 GMT")
+        self.assertEqual(fakeTime.formatted, [86400, 86401])
+
 
 
 class DummyHTTPHandler(http.Request):
@@ -49,8 +113,8 @@ class DummyHTTPHandler(http.Request):
         data = self.content.read()
         length = self.getHeader(b'content-length')
         if length is None:
-            length = networkString(str(length))
-        request = b"'''\n" + length + b"\n" + data + b"'''\n"
+            length = b'None'
+        request = b"".join([b"'''\n", length, b"\n", data, b"'''\n"])
         self.setResponseCode(200)
         self.setHeader(b"Request", self.uri)
         self.setHeader(b"Command", self.method)
@@ -89,20 +153,24 @@ class ResponseTestMixin(object):
             element of the tuple is a full header line without delimiter, except
             for the last element which gives the full response body.
         """
+        # Track the start of the next response rather than repeatedly copying
+        # the remainder of C{responses}.
+        offset = 0
         for response in expected:
             expectedHeaders, expectedContent = response[:-1], response[-1]
             # Intentionally avoid mutating the inputs here.
             expectedStatus = expectedHeaders[0]
             expectedHeaders = expectedHeaders[1:]
 
-            headers, rest = responses.split(b'\r\n\r\n', 1)
-            headers = headers.splitlines()
-            status = headers.pop(0)
+            headersEnd = responses.index(b'\r\n\r\n', offset)
+            headers = responses[offset:headersEnd].splitlines()
+            status = headers[0]
 
             self.assertEqual(expectedStatus, status)
-            self.assertEqual(set(headers), set(expectedHeaders))
-            content = rest[:len(expectedContent)]
-            responses = rest[len(expectedContent):]
+            self.assertEqual(set(headers[1:]), set(expectedHeaders))
+            contentStart = headersEnd + 4
+            offset = contentStart + len(expectedContent)
+            content = responses[contentStart:offset]
             self.assertEqual(content, expectedContent)
 
 
@@ -123,22 +191,46 @@ class HTTP1_0Tests(unittest.TestCase, ResponseTestMixin):
          b"Content-Length: 13",
          b"'''\nNone\n'''\n")]
 
-    def test_buffer(self):
+    def _sendRequests(self, chunkSize):
         """
-        Send requests over a channel and check responses match what is expected.
+        Send C{self.requests} over a channel, C{chunkSize} bytes at a time, and
+        check the responses match what is expected.
         """
         b = StringTransport()
         a = http.HTTPChannel()
         a.requestFactory = DummyHTTPHandler
         a.makeConnection(b)
-        # one byte at a time, to stress it.
-        for byte in iterbytes(self.requests):
-            a.dataReceived(byte)
+        for chunk in _inChunks(self.requests, chunkSize):
+            a.dataReceived(chunk)
         a.connectionLost(IOError("all one"))
         value = b.value()
         self.assertResponseEquals(value, self.expected_response)
 
 
+    def test_buffer(self):
+        """
+        Send requests over a channel and check responses match what is expected.
+        """
+        self._sendRequests(16)
+
+
+    def test_bufferAllAtOnce(self):
+        """
+        Requests delivered to a channel in a single C{dataReceived} call
+        produce the expected responses.
+        """
+        self._sendRequests(len(self.requests))
+
+
+    def test_bufferOneByteAtATime(self):
+        """
+        Requests delivered to a channel one byte at a time, which splits every
+        line and header at each possible point, produce the expected
+        responses.
+        """
+        self._sendRequests(1)
+
+
     def test_requestBodyTimeout(self):
         """
         L{HTTPChannel} resets its timeout whenever data from a request body is
@@ -481,8 +573,9 @@ class IdentityTransferEncodingTests(TestCase):
         with that string and the finish callback is invoked with a zero-length
         string.
         """
-        self.decoder.dataReceived(b'x' * self.contentLength)
-        self.assertEqual(self.data, [b'x' * self.contentLength])
+        body = b'x' * self.contentLength
+        self.decoder.dataReceived(body)
+        self.assertEqual(self.data, [body])
         self.assertEqual(self.finish, [b''])
 
 
@@ -496,8 +589,9 @@ class IdentityTransferEncodingTests(TestCase):
         self.decoder.dataReceived(b'x')
         self.assertEqual(self.data, [b'x'])
         self.assertEqual(self.finish, [])
-        self.decoder.dataReceived(b'y' * (self.contentLength - 1))
-        self.assertEqual(self.data, [b'x', b'y' * (self.contentLength - 1)])
+        rest = b'y' * (self.contentLength - 1)
+        self.decoder.dataReceived(rest)
+        self.assertEqual(self.data, [b'x', rest])
         self.assertEqual(self.finish, [b''])
 
 
@@ -508,8 +602,9 @@ class IdentityTransferEncodingTests(TestCase):
         of that string up to the content length is passed to the data callback
         and the remainder is passed to the finish callback.
         """
-        self.decoder.dataReceived(b'x' * self.contentLength + b'y')
-        self.assertEqual(self.data, [b'x' * self.contentLength])
+        body = b'x' * self.contentLength
+        self.decoder.dataReceived(body + b'y')
+        self.assertEqual(self.data, [body])
         self.assertEqual(self.finish, [b'y'])
 
 
@@ -522,15 +617,14 @@ class IdentityTransferEncodingTests(TestCase):
         def finish(bytes):
             try:
                 decoder.dataReceived(b'foo')
-            except:
-                failures.append(Failure())
+            except RuntimeError as e:
+                failures.append(e)
         decoder = _IdentityTransferDecoder(5, self.data.append, finish)
         decoder.dataReceived(b'x' * 4)
         self.assertEqual(failures, [])
         decoder.dataReceived(b'y')
-        failures[0].trap(RuntimeError)
         self.assertEqual(
-            str(failures[0].value),
+            str(failures[0]),
             "_IdentityTransferDecoder cannot decode data after finishing")
 
 
@@ -741,16 +835,23 @@ class ChunkingTests(unittest.TestCase):
         self.assertRaises(ValueError, http.fromChunk, b'-5\r\nmalformed!\r\n')
 
     def testConcatenatedChunks(self):
-        chunked = b''.join([b''.join(http.toChunk(t)) for t in self.strings])
+        chunked = b''.join(
+            chain.from_iterable(http.toChunk(t) for t in self.strings))
         result = []
-        buffer = b""
+        buffer = bytearray()
         for c in iterbytes(chunked):
-            buffer = buffer + c
+            buffer += c
+            # A complete chunk always ends with CRLF, so only try to parse one
+            # once a LF has arrived.
+            if c != b"\n":
+                continue
             try:
-                data, buffer = http.fromChunk(buffer)
-                result.append(data)
+                data, rest = http.fromChunk(bytes(buffer))
             except ValueError:
                 pass
+            else:
+                result.append(data)
+                buffer = bytearray(rest)
         self.assertEqual(result, self.strings)
 
 
@@ -833,7 +934,7 @@ class ParsingTests(unittest.TestCase):
                 requests.append(self)
 
         for u, p in [(b"foo", b"bar"), (b"hello", b"there:z")]:
-            s = base64.encodestring(b":".join((u, p))).strip()
+            s = base64.b64encode(b":".join((u, p)))
             f = b"GET / HTTP/1.0\nAuthorization: Basic " + s + b"\n\n"
             self.runRequest(f, Request, 0)
             req = requests.pop()
@@ -878,8 +979,9 @@ class ParsingTests(unittest.TestCase):
                 processed.append(self)
 
         requestLines = [b"GET / HTTP/1.0"]
-        for i in range(http.HTTPChannel.maxHeaders + 2):
-            requestLines.append(networkString("%s: foo" % (i,)))
+        requestLines.extend(
+            intToBytes(i) + b": foo"
+            for i in range(http.HTTPChannel.maxHeaders + 2))
         requestLines.extend([b"", b""])
 
         channel = self.runRequest(b"\n".join(requestLines), MyRequest, 0)
@@ -2504,7 +2606,7 @@ def sub(keys, d):
         corresponding values in C{d}.
     @rtype: L{dict}
     """
-    return dict([(k, d[k]) for k in keys])
+    return {k: d[k] for k in keys}
 
 
 
@@ -139,6 +139,8 @@ class BytesHeadersTests(TestCase):
         h = Headers()
         self.assertEqual(h._canonicalNameCaps(b"test"), b"Test")
         self.assertEqual(h._canonicalNameCaps(b"test-stuff"), b"Test-Stuff")
+        self.assertEqual(h._canonicalNameCaps(b"content-type"),
+                          b"Content-Type")
         self.assertEqual(h._canonicalNameCaps(b"content-md5"), b"Content-MD5")
         self.assertEqual(h._canonicalNameCaps(b"dnt"), b"DNT")
         self.assertEqual(h._canonicalNameCaps(b"etag"), b"ETag")